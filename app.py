@@ -25,18 +25,25 @@ Features:
 """
 
 import os
+import logging
 import tempfile
 from concurrent.futures import ThreadPoolExecutor
-import concurrent.futures
 import uuid
 import base64
 import mimetypes
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, render_template, request, flash, jsonify, send_file, redirect, url_for
 from werkzeug.utils import secure_filename
 
+# Parser/generator diagnostics go through `logging`; show INFO and up in the (gunicorn) logs
+logging.basicConfig(level=logging.INFO)
+
 # Import presentation generator functions
 from sfapps_template_generator import (
     create_presentation_from_template, 
@@ -66,6 +73,39 @@ app.config['MAX_CONTENT_LENGTH'] = MAX_CONTENT_LENGTH
 # Ensure uploads folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+# Pooled session for logo downloads (keeps TCP/TLS connections alive between requests)
+_logo_session = requests.Session()
+_logo_session.headers.update({
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
+    "Referer": "https://appexchange.salesforce.com/",
+})
+_logo_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                            max_retries=Retry(total=3, backoff_factor=0.3))
+_logo_session.mount('https://', _logo_adapter)
+_logo_session.mount('http://', _logo_adapter)
+
+# Successfully downloaded logos by URL; partners often share one logo across listings
+_LOGO_CACHE_SIZE = 256
+_logo_cache: "OrderedDict[str, Tuple[bytes, str]]" = OrderedDict()
+_logo_cache_lock = threading.Lock()
+
+
+def _get_cached_logo(logo_url: str) -> Optional[Tuple[bytes, str]]:
+    with _logo_cache_lock:
+        cached = _logo_cache.get(logo_url)
+        if cached is not None:
+            _logo_cache.move_to_end(logo_url)
+        return cached
+
+
+def _cache_logo(logo_url: str, logo_bytes: bytes, logo_mime: str) -> None:
+    with _logo_cache_lock:
+        _logo_cache[logo_url] = (logo_bytes, logo_mime)
+        _logo_cache.move_to_end(logo_url)
+        if len(_logo_cache) > _LOGO_CACHE_SIZE:
+            _logo_cache.popitem(last=False)
+
 
 # ---------- MIME helpers ----------
 
@@ -135,60 +175,67 @@ def fetch_multiple_app_metadata(urls: list) -> Dict[str, AppMetadata]:
     
     print(f"🚀 Fast batch parsing {len(urls)} links...")
     
-    # Common headers for image downloads
-    img_headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8", 
-        "Referer": "https://appexchange.salesforce.com/",
-    }
-
     def _download_logo(logo_url: str):
+        cached = _get_cached_logo(logo_url)
+        if cached is not None:
+            print(f"✅ Logo from cache: {logo_url}")
+            return cached
         print(f"🔄 Downloading logo: {logo_url}")
         try:
-            r = requests.get(logo_url, timeout=5, headers=img_headers)  # Was 10, now 5 seconds
+            r = _logo_session.get(logo_url, timeout=5)  # Was 10, now 5 seconds
             if r.status_code == 200:
                 logo_bytes = r.content
                 logo_mime = sniff_mime(logo_bytes, url_hint=logo_url, header_mime=r.headers.get("content-type", ""))
                 print(f"✅ Logo downloaded: {len(logo_bytes)} bytes")
+                _cache_logo(logo_url, logo_bytes, logo_mime)
                 return logo_bytes, logo_mime
         except Exception as e:
             print(f"❌ Logo download error: {e}")
         return b"", "image/png"
     
-    # Batch parsing of all URLs
-    # Parse each URL individually with fallback
-    parse_results = {}
-    for url in urls:
-        try:
-            result = parse_appexchange_improved(url)
-            parse_results[url] = result
-        except Exception as e:
-            print(f"❌ Failed to parse {url}: {e}")
-            parse_results[url] = {
-                'name': 'Manual input required',
-                'developer': 'Manual input required', 
-                'description': 'Manual input required',
-                'logo_url': None,
-                'success': False
-            }
-    
-    # Parallel logo downloads
     logo_downloads = {}
-    logo_urls_to_download = [(url, result.get('logo_url')) for url, result in parse_results.items() 
-                            if result.get('logo_url') and result.get('success')]
-    
-    print(f"🚀 Parallel download of {len(logo_urls_to_download)} logos...")
-    
     with ThreadPoolExecutor(max_workers=5) as executor:
-        future_to_url = {
-            executor.submit(_download_logo, logo_url): app_url 
-            for app_url, logo_url in logo_urls_to_download
-        }
+        # One download per distinct logo URL, even when several apps share it
+        future_by_logo = {}
+        
+        def _start_logo_download(url, result):
+            # Started as each listing is parsed, overlapping with the next page render
+            logo_url = result.get('logo_url')
+            if logo_url and result.get('success') and logo_url not in future_by_logo:
+                future_by_logo[logo_url] = executor.submit(_download_logo, logo_url)
+        
+        # Batch parsing of all URLs through one shared Chrome session
+        try:
+            parse_results = parse_multiple_appexchange_urls(urls, on_result=_start_logo_download)
+        except Exception as e:
+            print(f"❌ Batch parsing failed: {e}")
+            parse_results = {}
         
-        for future in concurrent.futures.as_completed(future_to_url):
-            app_url = future_to_url[future]
+        # Parse anything the batch did not return (e.g. driver crash) individually with fallback
+        for url in urls:
+            if url in parse_results:
+                continue
             try:
-                logo_bytes, logo_mime = future.result()
+                result = parse_appexchange_improved(url)
+                parse_results[url] = result
+            except Exception as e:
+                print(f"❌ Failed to parse {url}: {e}")
+                parse_results[url] = {
+                    'name': 'Manual input required',
+                    'developer': 'Manual input required', 
+                    'description': 'Manual input required',
+                    'logo_url': None,
+                    'success': False
+                }
+            _start_logo_download(url, parse_results[url])
+        
+        logo_urls_to_download = [(url, result.get('logo_url')) for url, result in parse_results.items() 
+                                if result.get('logo_url') and result.get('success')]
+        print(f"🚀 Waiting for {len(logo_urls_to_download)} logos...")
+        
+        for app_url, logo_url in logo_urls_to_download:
+            try:
+                logo_bytes, logo_mime = future_by_logo[logo_url].result()
                 logo_downloads[app_url] = (logo_bytes, logo_mime)
             except Exception as e:
                 print(f"❌ Logo download error for {app_url}: {e}")
@@ -218,19 +265,16 @@ def fetch_multiple_app_metadata(urls: list) -> Dict[str, AppMetadata]:
 
 def fetch_app_metadata_with_fallback(url: str) -> Optional[AppMetadata]:
     """Get metadata via single Selenium parser with Shadow DOM support"""
-    # Common headers for image downloads (WebP/SVG etc.)
-    img_headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
-        "Referer": "https://appexchange.salesforce.com/",
-    }
-
     def _download_logo(logo_url: str):
+        cached = _get_cached_logo(logo_url)
+        if cached is not None:
+            return cached
         try:
-            r = requests.get(logo_url, timeout=10, headers=img_headers)
+            r = _logo_session.get(logo_url, timeout=10)
             if r.status_code == 200:
                 logo_bytes = r.content
                 logo_mime = sniff_mime(logo_bytes, url_hint=logo_url, header_mime=r.headers.get("content-type", ""))
+                _cache_logo(logo_url, logo_bytes, logo_mime)
                 return logo_bytes, logo_mime
         except Exception as e:
             print(f"Logo download error: {e}")
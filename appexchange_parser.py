@@ -2,26 +2,60 @@
 # -*- coding: utf-8 -*-
 
 from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 from io import BytesIO
 import re
 import time
+import atexit
+import logging
+import threading
 import json
 import hashlib
 import os
+from collections import OrderedDict
+from functools import lru_cache
+from html import unescape
+from urllib.parse import urljoin
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
 
 CACHE_DIR = "/tmp/appexchange_cache"
 CACHE_EXPIRY_HOURS = 24
 
+# Shared keep-alive session: repeated AppExchange/logo fetches reuse TCP+TLS connections
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # 'br' is only decoded when the brotli package is installed (see requirements.txt)
+    'Accept-Encoding': 'br, gzip, deflate',
+    'Connection': 'keep-alive',
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                       max_retries=Retry(total=2, backoff_factor=0.3)))
+
+# The static probe runs in front of every Selenium parse, so it must fail fast:
+# short timeouts and no retries (the full fallbacks retry on _SESSION instead)
+_STATIC_PROBE_TIMEOUT = (3, 5)  # connect, read (seconds)
+_PROBE_SESSION = requests.Session()
+_PROBE_SESSION.headers.update(_SESSION.headers)
+_PROBE_SESSION.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
+
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+@lru_cache(maxsize=2048)
 def _get_cache_path(url: str) -> str:
-    if not os.path.exists(CACHE_DIR):
-        os.makedirs(CACHE_DIR)
     url_hash = hashlib.md5(url.encode()).hexdigest()
     return os.path.join(CACHE_DIR, f"cache_{url_hash}.json")
 
@@ -31,51 +65,175 @@ def _is_cache_valid(cache_path: str) -> bool:
     age_hours = (time.time() - os.path.getmtime(cache_path)) / 3600
     return age_hours < CACHE_EXPIRY_HOURS
 
+# In-process layer over the disk cache: {url: (saved_at, result)}, least recently used evicted first
+_MEMORY_CACHE = OrderedDict()
+_MEMORY_CACHE_SIZE = 1024
+_memory_cache_lock = threading.Lock()
+
+def _remember(url: str, data: dict, saved_at: float):
+    with _memory_cache_lock:
+        _MEMORY_CACHE[url] = (saved_at, data)
+        _MEMORY_CACHE.move_to_end(url)
+        if len(_MEMORY_CACHE) > _MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
 def _load_from_cache(url: str):
+    with _memory_cache_lock:
+        entry = _MEMORY_CACHE.get(url)
+        if entry is not None:
+            _MEMORY_CACHE.move_to_end(url)
+    if entry and (time.time() - entry[0]) / 3600 < CACHE_EXPIRY_HOURS:
+        return dict(entry[1])
+
     cache_path = _get_cache_path(url)
     if _is_cache_valid(cache_path):
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data
+            with open(cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+            _remember(url, data, os.path.getmtime(cache_path))
+            return dict(data)
         except Exception as e:
-            print(f" {e}")
+            logger.warning("Could not read cache for %s: %s", url, e)
     return None
 
 def _save_to_cache(url: str, data: dict):
+    _remember(url, dict(data), time.time())
     try:
         cache_path = _get_cache_path(url)
         with open(cache_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
     except Exception as e:
-        print(f"{e}")
+        logger.warning("Could not write cache for %s: %s", url, e)
 
 
 _JS_QUERY_SELECTOR_DEEP = r"""
 const selector = arguments[0];
 
-function qsd(sel, root) {
-  root = root || document;
-
-  if (root.querySelector) {
-    const direct = root.querySelector(sel);
-    if (direct) return direct;
+// Light DOM of the document first, then shadow roots breadth-first (FIFO via an
+// index pointer), shallowest first; native querySelector per root
+const roots = [document];
+for (let next = 0; next < roots.length; next++) {
+  const root = roots[next];
+  const hit = root.querySelector(selector);
+  if (hit) return hit;
+  for (const el of root.querySelectorAll('*')) {
+    if (el.shadowRoot) roots.push(el.shadowRoot);
   }
+}
+return null;
+"""
 
-  const walker = document.createTreeWalker(root, NodeFilter.SHOW_ELEMENT);
-  let node = walker.currentNode;
-  while (node) {
-    if (node.shadowRoot) {
-      const found = qsd(sel, node.shadowRoot);
-      if (found) return found;
+_JS_QUERY_SELECTORS_DEEP = r"""
+const selectors = arguments[0];
+const found = selectors.map(() => null);
+let pending = selectors.length;
+
+// One walk resolves every selector: light DOM of the document first, then
+// shadow roots breadth-first (FIFO), shallowest first
+const roots = [document];
+for (let next = 0; next < roots.length && pending; next++) {
+  const root = roots[next];
+  selectors.forEach((sel, i) => {
+    if (found[i] === null) {
+      const hit = root.querySelector(sel);
+      if (hit) { found[i] = hit; pending--; }
     }
-    node = walker.nextNode();
+  });
+  for (const el of root.querySelectorAll('*')) {
+    if (el.shadowRoot) roots.push(el.shadowRoot);
   }
-  return null;
 }
-return qsd(selector, document);
+return found;
 """
 
+# Static assets the parser never looks at; blocking them keeps driver.get()
+# bound to the HTML + app JS instead of megabytes of images and fonts.
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff*", "*.css",
+    "*google-analytics*", "*googletagmanager*", "*doubleclick*", "*facebook*", "*adservice*",
+]
+
+
+def _build_chrome_options() -> Options:
+    chrome_options = Options()
+    chrome_options.add_argument("--headless=new")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-features=Translate,MediaRouter")
+    chrome_options.add_argument("--window-size=1280,720")
+    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    # Chrome has no content setting for fonts or CSS; those are blocked via _BLOCKED_URL_PATTERNS
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+    })
+    # Return from driver.get() at DOMContentLoaded instead of the load event
+    chrome_options.set_capability("pageLoadStrategy", "eager")
+    return chrome_options
+
+
+def _block_heavy_resources(driver):
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning("⚠️ Could not enable resource blocking: %s", e)
+
+
+def _start_driver(chrome_options):
+    # Selenium Manager (bundled with Selenium 4.11+) resolves and caches chromedriver
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    _block_heavy_resources(driver)
+    return driver
+
+
+def _driver_alive(driver):
+    # A dead chromedriver process surfaces as urllib3/socket errors, not WebDriverException
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+# Process-wide driver for every Selenium parse (single and batch), started lazily and quit at exit
+_shared_driver = None
+_shared_driver_lock = threading.Lock()
+
+
+def _get_shared_driver():
+    """Return the shared driver, restarting it if the session died; caller holds the lock"""
+    global _shared_driver
+    if _shared_driver is not None and not _driver_alive(_shared_driver):
+        # Reset first: a failing quit() must never leave the dead driver in place
+        dead, _shared_driver = _shared_driver, None
+        try:
+            dead.quit()
+        except Exception:
+            pass
+    if _shared_driver is None:
+        _shared_driver = _start_driver(_build_chrome_options())
+    return _shared_driver
+
+
+@atexit.register
+def _quit_shared_driver():
+    if _shared_driver is not None:
+        try:
+            _shared_driver.quit()
+        except Exception:
+            pass
+
+
 def find_element_deep(driver, selector: str, timeout: int = 3):
 
     return WebDriverWait(driver, timeout).until(
@@ -84,58 +242,204 @@ def find_element_deep(driver, selector: str, timeout: int = 3):
     )
 
 
-def parse_appexchange_simple(url: str):
-    """Simple HTTP-based parser as fallback when Selenium fails"""
-    print("🔄 Using simple HTTP parser as fallback...")
-    
+def find_elements_deep(driver, selectors: list):
+    """Resolve several selectors (light + shadow DOM) in one round trip, no waiting; None per miss"""
+    return driver.execute_script(_JS_QUERY_SELECTORS_DEEP, list(selectors))
+
+
+_APPEXCHANGE_BASE_URL = "https://appexchange.salesforce.com/"
+
+# Browser-like headers live on _SESSION; only Accept is page-specific
+_HTML_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+}
+
+_INITIAL_STATE_KEY = '__INITIAL_STATE__'
+
+_META_TAG_RE = re.compile(r'<meta\b[^>]*>', re.IGNORECASE)
+_META_ATTR_RE = re.compile(r'([\w:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+
+_TITLE_RE = re.compile(r'<title[^>]*>([^|]+)', re.IGNORECASE)
+_JSON_NAME_RE = re.compile(r'"name"\s*:\s*"([^"]+)"')
+_META_DESCRIPTION_RE = re.compile(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', re.IGNORECASE)
+_JSON_DESCRIPTION_RE = re.compile(r'"description"\s*:\s*"([^"]+)"')
+_APPEXCHANGE_SUFFIX_RE = re.compile(r"\s*\|\s*(Salesforce\s+)?AppExchange.*$", re.IGNORECASE)
+
+# Tried in order; the first match longer than 5 chars wins
+_COMPANY_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'"publisher"\s*:\s*"[^"]*"[^}]*"name"\s*:\s*"([^"]+)"',
+    r'"company"\s*:\s*"([^"]+)"',
+    r'"developer"\s*:\s*"([^"]+)"',
+    r'"publisher"\s*:\s*"([^"]+)"',
+    r'by\s+([^<>\n]+)',
+    r'Company[:\s]+([^<>\n]+)',
+    r'Developer[:\s]+([^<>\n]+)',
+)]
+
+_LOGO_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'"Logo"\s*:\s*"([^"]+)"',
+    r'"logo_url"\s*:\s*"([^"]+)"',
+    r'"Big Logo"\s*:\s*"([^"]+)"',
+    r'<img[^>]*src=["\']([^"\']*logo[^"\']*)["\']',
+    r'<img[^>]*src=["\']([^"\']*icon[^"\']*)["\']',
+)]
+
+# Known locations of listing fields inside the __INITIAL_STATE__ blob, in priority order
+_INITIAL_STATE_PATHS = {
+    'name': [('listing', 'title'), ('listing', 'name')],
+    'developer': [('listing', 'publisher', 'name'), ('listing', 'publisherName')],
+    'description': [('listing', 'description')],
+    'logo_url': [('listing', 'bigLogo'), ('listing', 'logo')],
+}
+
+
+def _find_initial_state_start(html: str) -> int:
+    """Offset just past '__INITIAL_STATE__ =' or -1; literal str.find instead of a regex scan"""
+    pos = html.find(_INITIAL_STATE_KEY)
+    while pos >= 0:
+        end = pos + len(_INITIAL_STATE_KEY)
+        while end < len(html) and html[end].isspace():
+            end += 1
+        if html.startswith('=', end):
+            end += 1
+            while end < len(html) and html[end].isspace():
+                end += 1
+            return end
+        pos = html.find(_INITIAL_STATE_KEY, end)
+    return -1
+
+
+# raw_decode stops at the end of the blob; orjson has no equivalent, so keep json here
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _read_initial_state(html: str):
+    """Decode the __INITIAL_STATE__ JSON blob embedded in the page, if any"""
+    start = _find_initial_state_start(html)
+    if start < 0:
+        return None
     try:
-        # Headers to mimic a real browser
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=10)
+        state, _ = _JSON_DECODER.raw_decode(html, start)
+    except ValueError:
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _lookup_initial_state(state: dict, field: str):
+    for path in _INITIAL_STATE_PATHS[field]:
+        node = state
+        for key in path:
+            node = node.get(key) if isinstance(node, dict) else None
+        if isinstance(node, str) and node.strip():
+            return node.strip()
+    return None
+
+
+def _absolute_logo_url(logo_url: str) -> str:
+    # urljoin also covers protocol-relative "//host/path" URLs
+    if logo_url and not logo_url.startswith('http'):
+        return urljoin(_APPEXCHANGE_BASE_URL, logo_url)
+    return logo_url
+
+
+def _read_meta_tags(html: str) -> dict:
+    """Map og:/twitter:/name meta keys to their content attribute"""
+    metas = {}
+    for tag in _META_TAG_RE.findall(html):
+        attrs = {k.lower(): dq or sq for k, dq, sq in _META_ATTR_RE.findall(tag)}
+        key = attrs.get('property') or attrs.get('name')
+        if key and 'content' in attrs:
+            metas.setdefault(key.lower(), unescape(attrs['content']).strip())
+    return metas
+
+
+def _fetch_static_html(url: str):
+    """One quick GET of the server-rendered page; None if it is slow or fails"""
+    try:
+        response = _PROBE_SESSION.get(url, headers=_HTML_HEADERS, timeout=_STATIC_PROBE_TIMEOUT)
         response.raise_for_status()
+    except requests.RequestException as e:
+        logger.info("⚠️ Static fetch failed, using Selenium: %s", e)
+        return None
+    return response.text
+
+
+def _parse_static_listing(html: str):
+    """
+    Fast path: read the listing from the server-rendered HTML (page state +
+    OpenGraph/Twitter meta) without starting Chrome. Returns None when the
+    static page does not carry both the name and the developer.
+    """
+    name = developer = logo_url = None
+
+    state = _read_initial_state(html)
+    if state:
+        name = _lookup_initial_state(state, 'name')
+        developer = _lookup_initial_state(state, 'developer')
+        logo_url = _lookup_initial_state(state, 'logo_url')
+
+    metas = _read_meta_tags(html)
+    if not name and metas.get('og:title'):
+        name = _APPEXCHANGE_SUFFIX_RE.sub("", metas['og:title']).strip()
+    developer = developer or metas.get('twitter:data1')
+    logo_url = logo_url or metas.get('og:image')
+
+    if not (name and developer):
+        return None
+    return {
+        "name": name,
+        "developer": developer,
+        "logo_url": _absolute_logo_url(logo_url),
+        "success": True
+    }
+
+
+def parse_appexchange_simple(url: str, html: str = None):
+    """Simple HTTP-based parser as fallback when Selenium fails; reuses already fetched html if given"""
+    logger.info("🔄 Using simple HTTP parser as fallback for %s", url)
+    
+    try:
+        if html is None:
+            response = _SESSION.get(url, headers=_HTML_HEADERS, timeout=10)
+            response.raise_for_status()
+            html = response.text
+
+        # Fast path: one JSON decode of the page state instead of the regex sweep below
+        state = _read_initial_state(html)
+        if state:
+            name = _lookup_initial_state(state, 'name')
+            company = _lookup_initial_state(state, 'developer')
+            if name and company:
+                return {
+                    'name': name,
+                    'developer': company,
+                    'description': _lookup_initial_state(state, 'description') or "Manual input required",
+                    'logo_url': _absolute_logo_url(_lookup_initial_state(state, 'logo_url')),
+                    'success': True,
+                    'parsed_with': 'simple_http'
+                }
         
-        html = response.text
-        
-        # Try to extract name from title tag
-        name_match = re.search(r'<title[^>]*>([^|]+)', html, re.IGNORECASE)
-        name = name_match.group(1).strip() if name_match else "Manual input required"
-        
-        # Also try to extract from JSON data if available
-        json_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
-        if json_match and json_match.group(1) != name:
+        # JSON data wins over the title tag, so only scan for the title when it is missing
+        json_match = _JSON_NAME_RE.search(html)
+        if json_match:
             name = json_match.group(1).strip()
+        else:
+            name_match = _TITLE_RE.search(html)
+            name = name_match.group(1).strip() if name_match else "Manual input required"
         
-        # Try to extract from meta description or page content
-        desc_match = re.search(r'<meta[^>]*name=["\']description["\'][^>]*content=["\']([^"\']+)', html, re.IGNORECASE)
-        description = desc_match.group(1).strip() if desc_match else "Manual input required"
-        
-        # Also try from JSON data
-        json_desc = re.search(r'"description"\s*:\s*"([^"]+)"', html)
+        # Likewise JSON description first, meta description only as fallback
+        json_desc = _JSON_DESCRIPTION_RE.search(html)
         if json_desc:
             description = json_desc.group(1).strip()
+        else:
+            desc_match = _META_DESCRIPTION_RE.search(html)
+            description = desc_match.group(1).strip() if desc_match else "Manual input required"
         
         # Try to find developer/company info
         # Look for publisher/company in JSON data first
-        company_patterns = [
-            r'"publisher"\s*:\s*"[^"]*"[^}]*"name"\s*:\s*"([^"]+)"',
-            r'"company"\s*:\s*"([^"]+)"',
-            r'"developer"\s*:\s*"([^"]+)"',
-            r'"publisher"\s*:\s*"([^"]+)"',
-            r'by\s+([^<>\n]+)',
-            r'Company[:\s]+([^<>\n]+)',
-            r'Developer[:\s]+([^<>\n]+)',
-        ]
-        
         company = "Manual input required"
-        for pattern in company_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _COMPANY_PATTERNS:
+            match = pattern.search(html)
             if match:
                 company = match.group(1).strip()
                 # Clean up common suffixes
@@ -143,21 +447,11 @@ def parse_appexchange_simple(url: str):
                     break
         
         # Try to find logo from JSON data
-        logo_patterns = [
-            r'"Logo"\s*:\s*"([^"]+)"',
-            r'"logo_url"\s*:\s*"([^"]+)"',
-            r'"Big Logo"\s*:\s*"([^"]+)"',
-            r'<img[^>]*src=["\']([^"\']*logo[^"\']*)["\']',
-            r'<img[^>]*src=["\']([^"\']*icon[^"\']*)["\']',
-        ]
-        
         logo_url = None
-        for pattern in logo_patterns:
-            match = re.search(pattern, html, re.IGNORECASE)
+        for pattern in _LOGO_PATTERNS:
+            match = pattern.search(html)
             if match:
-                logo_url = match.group(1)
-                if logo_url and not logo_url.startswith('http'):
-                    logo_url = f"https://appexchange.salesforce.com{logo_url}"
+                logo_url = _absolute_logo_url(match.group(1))
                 break
         
         return {
@@ -170,7 +464,7 @@ def parse_appexchange_simple(url: str):
         }
         
     except Exception as e:
-        print(f"❌ Simple parser failed: {e}")
+        logger.warning("❌ Simple parser failed: %s", e)
         return {
             'name': 'Manual input required',
             'developer': 'Manual input required', 
@@ -181,70 +475,46 @@ def parse_appexchange_simple(url: str):
         }
 
 
-def parse_appexchange_improved(url: str, driver=None, reuse_driver=False):
-
+def _parse_without_browser(url: str):
+    """Cache, then the static HTML; returns (result or None, static html or None)"""
     cached_result = _load_from_cache(url)
     if cached_result:
-        return cached_result
-    
-    start_time = time.time()
+        return cached_result, None
 
-    driver_was_provided = driver is not None
-    
-    if not driver_was_provided:
-        driver_start = time.time()
-        chrome_options = Options()
-        chrome_options.add_argument("--headless=new")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-images") 
-        chrome_options.add_argument("--window-size=1280,720")  
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
+    # Selenium is the slow path: only render the page when the static HTML is not enough
+    static_html = _fetch_static_html(url)
+    static_result = _parse_static_listing(static_html) if static_html else None
+    if static_result:
+        _save_to_cache(url, static_result)
+        return static_result, static_html
+    return None, static_html
 
-    try:
-        if not driver_was_provided:
-            try:
-                service = Service(ChromeDriverManager().install())
-                driver = webdriver.Chrome(service=service, options=chrome_options)
-                driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-                driver_init_time = time.time() - driver_start
-            except Exception as chrome_error:
-                print(f"❌ ChromeDriver failed: {chrome_error}")
-                print("🔄 Trying simple HTTP parser as fallback...")
-                return parse_appexchange_simple(url)
 
+def _render_listing(url: str, driver):
+    """Extract the listing from the page rendered by driver; errors become a failed result"""
+    start_time = time.time()
+
+    try:
         nav_start = time.time()
         driver.get(url)
         nav_time = time.time() - nav_start
 
-        sleep_start = time.time()
-        time.sleep(0.2) 
-        sleep_time = time.time() - sleep_start
-
         # ===== NAME (.listing-title h1) =====
+        # Waiting on the title itself (light or shadow DOM) doubles as the
+        # hydration wait: returns immediately on fast pages, keeps polling on slow ones.
         name_start = time.time()
         app_name = None
         
         try:
-            name_el = driver.find_element("css selector", ".listing-title h1")
+            name_el = find_element_deep(driver, ".listing-title h1", timeout=5)
             app_name = (name_el.text or "").strip()
-        except:
-            try:
-                name_el = find_element_deep(driver, ".listing-title h1", timeout=3)
-                app_name = (name_el.text or "").strip()
-            except TimeoutException:
-                # fallback from <title>
-                title = (driver.title or "").strip()
-                if title:
-                    app_name = re.sub(r"\s*\|\s*(Salesforce\s+)?AppExchange.*$", "", title, flags=re.IGNORECASE).strip()
+        except TimeoutException:
+            # fallback from <title>
+            app_name = (driver.title or "").strip()
 
+        # Single cleanup pass for either source
         if app_name:
-            app_name = re.sub(r"\s*\|\s*(Salesforce\s+)?AppExchange.*$", "", app_name, flags=re.IGNORECASE).strip()
+            app_name = _APPEXCHANGE_SUFFIX_RE.sub("", app_name).strip()
         
         name_time = time.time() - name_start
 
@@ -252,15 +522,18 @@ def parse_appexchange_improved(url: str, driver=None, reuse_driver=False):
         dev_start = time.time()
         developer = None
         
+        # The title is rendered by now, so developer and logo usually resolve in one call
         try:
-            dev_el = driver.find_element("css selector", ".listing-title p")
-            developer = (dev_el.text or "").strip()
-        except:
-            try:
+            dev_el, img_el = find_elements_deep(driver, [".listing-title p", ".listing-logo img"])
+        except WebDriverException:
+            dev_el = img_el = None
+        
+        try:
+            if dev_el is None:
                 dev_el = find_element_deep(driver, ".listing-title p", timeout=2)
-                developer = (dev_el.text or "").strip()
-            except TimeoutException:
-                pass  # No developer found
+            developer = (dev_el.text or "").strip()
+        except TimeoutException:
+            pass  # No developer found
         
         dev_time = time.time() - dev_start
 
@@ -269,24 +542,19 @@ def parse_appexchange_improved(url: str, driver=None, reuse_driver=False):
         logo_url = None
         
         try:
-            img_el = driver.find_element("css selector", ".listing-logo img")
+            if img_el is None:
+                img_el = find_element_deep(driver, ".listing-logo img", timeout=2)
             src = (img_el.get_attribute("src") or "").strip()
             if src:
                 logo_url = ("https:" + src) if src.startswith("//") else src
-        except:
+        except TimeoutException:
             try:
-                img_el = find_element_deep(driver, ".listing-logo img", timeout=2)
-                src = (img_el.get_attribute("src") or "").strip()
-                if src:
-                    logo_url = ("https:" + src) if src.startswith("//") else src
-            except TimeoutException:
-                try:
-                    og_img = driver.find_element("css selector", 'meta[property="og:image"]')
-                    logo_url = og_img.get_attribute("content")
-                    if logo_url:
-                        logo_url = logo_url.strip()
-                except Exception:
-                    print("❌ Could not find og:image")
+                og_img = driver.find_element("css selector", 'meta[property="og:image"]')
+                logo_url = og_img.get_attribute("content")
+                if logo_url:
+                    logo_url = logo_url.strip()
+            except Exception:
+                logger.debug("❌ Could not find og:image for %s", url)
         
         logo_time = time.time() - logo_start
 
@@ -315,56 +583,64 @@ def parse_appexchange_improved(url: str, driver=None, reuse_driver=False):
             "error": str(e),
         }
         return result
-    finally:
-        if driver and not driver_was_provided and not reuse_driver:
-            driver.quit()
 
 
-def parse_multiple_appexchange_urls(urls: list):
+def _render_with_shared_driver(url: str):
+    """Render url in the process-wide Chrome, one page at a time; None if Chrome cannot start"""
+    with _shared_driver_lock:
+        try:
+            driver = _get_shared_driver()
+        except Exception as chrome_error:
+            logger.warning("❌ ChromeDriver failed: %s", chrome_error)
+            return None
+        try:
+            return _render_listing(url, driver)
+        finally:
+            # Keep listings independent: no consent/session cookies carried over
+            try:
+                driver.delete_all_cookies()
+            except Exception:
+                pass  # a dead driver is replaced by _get_shared_driver on the next render
+
+
+def parse_appexchange_improved(url: str, driver=None):
+
+    result, static_html = _parse_without_browser(url)
+    if result:
+        return result
+
+    if driver is not None:
+        return _render_listing(url, driver)
+
+    result = _render_with_shared_driver(url)
+    if result is None:
+        # Outside the driver lock: a plain HTTP parse must not block other renders
+        logger.info("🔄 Trying simple HTTP parser instead of Chrome for %s", url)
+        return parse_appexchange_simple(url, html=static_html)
+    return result
+
+
+def parse_multiple_appexchange_urls(urls: list, on_result=None):
+    """Parse listings through the process-wide driver; on_result(url, result) fires as each one finishes"""
     if not urls:
         return {}
+
+    # Repeated links would each pay a full page load; results are keyed by URL anyway
+    unique_urls = list(dict.fromkeys(urls))
         
     batch_start = time.time()
     
-    driver_init_start = time.time()
-    chrome_options = Options()
-    chrome_options.add_argument("--headless=new")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-images") 
-    chrome_options.add_argument("--window-size=1280,720") 
-    chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option("useAutomationExtension", False)
-    
     results = {}
-    driver = None
-    
-    try:
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        driver_init_time = time.time() - driver_init_start
-        
-        for i, url in enumerate(urls, 1):
-            url_start = time.time()
-            print(f"📍 [{i}/{len(urls)}] Парсинг: {url}")
-            result = parse_appexchange_improved(url, driver=driver, reuse_driver=True)
-            results[url] = result
-            url_time = time.time() - url_start
-            print(f"⏱️ URL #{i} время: {url_time:.2f}c")
-            
-    except Exception as e:
-        print(f" {e}")
-    finally:
-        if driver:
-            close_start = time.time()
-            driver.quit()
-            close_time = time.time() - close_start
+    for i, url in enumerate(unique_urls, 1):
+        url_start = time.time()
+        logger.info("📍 [%d/%d] Парсинг: %s", i, len(unique_urls), url)
+        # Chrome is only touched (and started, or restarted if dead) for listings that need rendering
+        result = parse_appexchange_improved(url)
+        results[url] = result
+        if on_result:
+            on_result(url, result)
+        url_time = time.time() - url_start
+        logger.debug("⏱️ URL #%d время: %.2fc", i, url_time)
             
     batch_total = time.time() - batch_start
 
@@ -376,7 +652,7 @@ def download_logo(logo_url: str, target_size=(100, 100)):
     if not logo_url:
         return None
     try:
-        resp = requests.get(logo_url, timeout=10)
+        resp = _SESSION.get(logo_url, timeout=10)
         if resp.status_code == 200:
             img = Image.open(BytesIO(resp.content))
             img.thumbnail(target_size)
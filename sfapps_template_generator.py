@@ -48,19 +48,31 @@ Requirements
 * python-pptx
 * requests
 * beautifulsoup4
+* lxml (optional, faster HTML parser backend for BeautifulSoup)
 * Pillow (for image scaling)
 * LibreOffice in headless mode (optional, for PDF conversion)
 """
 
+import hashlib
+import json
+import logging
 import os
 import re
 import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
 from io import BytesIO
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urljoin
 
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from PIL import Image
 from pptx import Presentation
@@ -70,11 +82,95 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.oxml.ns import qn
 from pptx.util import Pt
 
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401  (C parser backend for BeautifulSoup)
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Keep-alive session shared by the listing page and logo fetches (same host)
+_SESSION = requests.Session()
+_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36',
+    # urllib3 decodes br via the brotli package in requirements.txt
+    'Accept-Encoding': 'br, gzip, deflate',
+})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
+_BY_TEXT_RE = re.compile(r'By\s+', re.IGNORECASE)
+_BY_PREFIX_RE = re.compile(r'by\s+(.*)', re.IGNORECASE | re.DOTALL)
+
+# CSS selectors per field, in priority order (based on AppExchange HTML structure)
+_NAME_SELECTORS = (
+    'h1[type="style"]',
+    '.listing-title h1',
+    'h1',
+    '[data-testid="listing-title"]',
+)
+_DEV_SELECTORS = (
+    'p[type="style"]',  # e.g. "By TaskRay"
+    '.listing-title p',
+    'p',
+    '[data-testid="listing-publisher"]',
+)
+_LOGO_SELECTORS = (
+    'img.ads-image',
+    '.ads-image',
+    '.listing-logo img',
+    '.summary img',
+    'img[class*="ads-image"]',
+)
+
+
+# Substrings at least one of which must be present for any name strategy to match
+_NAME_SOURCE_NEEDLES = ('<h1', '<H1', 'listing-title', 'application/json', 'og:title')
+_NAME_SOURCE_NEEDLES_BYTES = tuple(needle.encode() for needle in _NAME_SOURCE_NEEDLES)
+
+
+def _compile_selector_group(selectors):
+    """Compile a priority-ordered selector list once: the union plus each selector."""
+    union = soupsieve.compile(', '.join(selectors))
+    return union, [(selector, soupsieve.compile(selector)) for selector in selectors]
+
+
+_NAME_CSS = _compile_selector_group(_NAME_SELECTORS)
+_DEV_CSS = _compile_selector_group(_DEV_SELECTORS)
+_LOGO_CSS = _compile_selector_group(_LOGO_SELECTORS)
+
+
+def _first_matches(soup, selector_group):
+    """
+    Yield ``(selector, element)`` for each selector that matches, in
+    priority order, where ``element`` is the first match in document
+    order (same result as calling ``select_one`` per selector).  The
+    tree is walked once with the comma-joined selector list; the
+    individual selectors are then only matched against the candidates.
+    """
+    union, compiled = selector_group
+    candidates = union.select(soup)
+    for selector, pattern in compiled:
+        for element in candidates:
+            if pattern.match(element):
+                yield selector, element
+                break
+
 
 @dataclass
 class AppMetadata:
     """Container for app details extracted from an AppExchange listing."""
 
+    # Declared by hand: dataclass(slots=True) needs Python 3.10 (Docker uses 3.9)
+    __slots__ = ('url', 'name', 'developer', 'logo_bytes', 'logo_mime')
+
     url: str
     name: str
     developer: str
@@ -82,7 +178,20 @@ class AppMetadata:
     logo_mime: str
 
 
-def _extract_from_html(html: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+def _index_meta_tags(soup) -> Dict[str, str]:
+    """
+    Map each ``<meta>`` ``property``/``name`` value to its ``content``.
+    Only the first tag per key is kept, mirroring ``soup.find``.
+    """
+    metas: Dict[str, str] = {}
+    for meta in soup.find_all('meta'):
+        key = meta.get('property') or meta.get('name')
+        if key and key not in metas:
+            metas[key] = meta.get('content') or ''
+    return metas
+
+
+def _extract_from_html(html: Union[str, bytes]) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """
     Given the HTML body of an AppExchange listing this helper will try
     to extract the application name, the developer/publisher and a
@@ -91,80 +200,64 @@ def _extract_from_html(html: str) -> Tuple[Optional[str], Optional[str], Optiona
 
     Parameters
     ----------
-    html: str
-        Raw HTML string from the AppExchange listing page.
+    html: str or bytes
+        Raw HTML from the AppExchange listing page.  Bytes are handed
+        straight to the parser, which detects the encoding itself.
 
     Returns
     -------
     (name, developer, logo_url): Tuple of three strings or ``None`` if
     a field cannot be determined.
     """
-    soup = BeautifulSoup(html, 'html.parser')
+    # Cheap reject for error pages/interstitials: without any possible name
+    # source the listing is unusable, so skip building the tree at all
+    needles = _NAME_SOURCE_NEEDLES if isinstance(html, str) else _NAME_SOURCE_NEEDLES_BYTES
+    if not any(needle in html for needle in needles):
+        return None, None, None
+
+    soup = BeautifulSoup(html, _HTML_PARSER)
     name = None
     dev = None
     logo = None
     
     # Try CSS selectors first (most reliable for AppExchange)
-    # Correct selectors for title (based on HTML structure)
-    name_selectors = [
-        'h1[type="style"]',  # Visible in HTML on the right
-        '.listing-title h1',
-        'h1',
-        '[data-testid="listing-title"]'
-    ]
-    for selector in name_selectors:
-        element = soup.select_one(selector)
-        if element:
-            text = element.get_text().strip()
-            if text:  # Make sure text is not empty
-                name = text
-                print(f"Found title via selector '{selector}': {name}")
-                break
+    for selector, element in _first_matches(soup, _NAME_CSS):
+        text = element.get_text().strip()
+        if text:  # Make sure text is not empty
+            name = text
+            logger.debug("Found title via selector '%s': %s", selector, name)
+            break
 
-    # Correct selectors for developer (based on HTML structure)
-    dev_selectors = [
-        'p[type="style"]',  # Visible in HTML on the right - "By TaskRay"
-        '.listing-title p',
-        'p',
-        '[data-testid="listing-publisher"]'
-    ]
-    for selector in dev_selectors:
-        element = soup.select_one(selector)
-        if element:
-            dev_text = element.get_text().strip()
-            if dev_text:  # Make sure text is not empty
-                # Remove "By " prefix if present
-                if dev_text.lower().startswith('by '):
-                    dev = dev_text[3:].strip()
-                else:
-                    dev = dev_text
-                print(f"Found developer via selector '{selector}': {dev}")
-                break
+    for selector, element in _first_matches(soup, _DEV_CSS):
+        dev_text = element.get_text().strip()
+        if dev_text:  # Make sure text is not empty
+            # Remove "By " prefix if present
+            by_match = _BY_PREFIX_RE.match(dev_text)
+            dev = by_match.group(1).strip() if by_match else dev_text
+            logger.debug("Found developer via selector '%s': %s", selector, dev)
+            break
 
-    # Correct selectors for logo (based on HTML structure)
-    logo_selectors = [
-        'img.ads-image',  # Exactly as shown in HTML on the right
-        '.ads-image',
-        '.listing-logo img',
-        '.summary img',
-        'img[class*="ads-image"]'
-    ]
-    for selector in logo_selectors:
-        element = soup.select_one(selector)
-        if element:
-            # Try different attributes for image URL
-            logo = element.get('src') or element.get('data-src') or element.get('data-original') or element.get('data-lazy')
-            if logo:
-                print(f"Found logo via selector '{selector}': {logo}")
-                break
+    for selector, element in _first_matches(soup, _LOGO_CSS):
+        # Try different attributes for image URL
+        logo = element.get('src') or element.get('data-src') or element.get('data-original') or element.get('data-lazy')
+        if logo:
+            logger.debug("Found logo via selector '%s': %s", selector, logo)
+            break
     
-    # Try to extract from JSON script tags only if CSS failed
-    if not all([name, dev, logo]):
+    # Try to extract from JSON script tags only if CSS failed; this stage can
+    # only supply name/developer, so a missing logo alone does not justify it
+    if not (name and dev):
         script_tags = soup.find_all('script', type='application/json')
         for script in script_tags:
+            text = script.get_text().lstrip()
+            # Only JSON objects are inspected below; skip anything else unparsed
+            if not text.startswith('{'):
+                continue
+            # Only blobs carrying a "name"/"title" key can match below; skip the rest unparsed
+            if '"name"' not in text and '"title"' not in text:
+                continue
             try:
-                import json
-                data = json.loads(script.get_text())
+                data = _json_loads(text)
                 # Try to find app data in JSON structure
                 if isinstance(data, dict):
                     # Look for common patterns in JSON data
@@ -176,33 +269,30 @@ def _extract_from_html(html: str) -> Tuple[Optional[str], Optional[str], Optiona
                             elif 'title' in value and 'publisher' in value:
                                 name = name or value.get('title')
                                 dev = dev or value.get('publisher')
-            except:
+            except (ValueError, TypeError):
                 continue
     
-    # Final fallback to OpenGraph metadata
+    # Final fallback to OpenGraph metadata; index the meta tags in a single pass
+    metas = _index_meta_tags(soup) if not (name and dev and logo) else {}
     if not name:
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            title_content = og_title['content']
+        title_content = metas.get('og:title')
+        if title_content:
             # Remove common suffixes like "| Salesforce AppExchange"
             if '|' in title_content:
                 name = title_content.split('|')[0].strip()
             else:
                 name = title_content.strip()
     
-    if not logo:
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            logo = og_image['content']
+    if not logo and metas.get('og:image'):
+        logo = metas['og:image']
     
     if not dev:
         # Look for Twitter metadata
-        twitter_data1 = soup.find('meta', attrs={'name': 'twitter:data1'})
-        if twitter_data1 and twitter_data1.get('content'):
-            dev = twitter_data1['content'].strip()
+        if metas.get('twitter:data1'):
+            dev = metas['twitter:data1'].strip()
         else:
-            # Look for any span/text containing "By"
-            by_elements = soup.find_all(string=re.compile(r'By\s+', re.IGNORECASE))
+            # Look for any span/text containing "By"; only the first hit is used
+            by_elements = soup.find_all(string=_BY_TEXT_RE, limit=1)
             for by_text in by_elements:
                 if by_text.strip():
                     dev = by_text.replace('By', '').strip()
@@ -211,10 +301,152 @@ def _extract_from_html(html: str) -> Tuple[Optional[str], Optional[str], Optiona
     return name, dev, logo
 
 
-def fetch_app_metadata(url: str, timeout: int = 20) -> Optional[AppMetadata]:
+# On-disk cache of fetched listings: meta/<sha1>.json next to logos/<sha1>.bin
+METADATA_CACHE_DIR = os.environ.get(
+    'SFAPPS_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'sfapps')
+)
+METADATA_CACHE_MAX_AGE = 7 * 24 * 3600  # seconds
+
+# In-process memo in front of the disk cache: {url: (saved_at, AppMetadata)}.
+# Entries hold logo bytes, so keep it small; least recently used evicted first
+_METADATA_MEMO: "OrderedDict[str, Tuple[float, AppMetadata]]" = OrderedDict()
+_METADATA_MEMO_SIZE = 128
+_metadata_memo_lock = threading.Lock()
+
+
+def _memo_get(url: str) -> Optional[Tuple[float, AppMetadata]]:
+    with _metadata_memo_lock:
+        entry = _METADATA_MEMO.get(url)
+        if entry is not None:
+            _METADATA_MEMO.move_to_end(url)
+        return entry
+
+
+def _memo_put(url: str, saved_at: float, meta: AppMetadata) -> None:
+    with _metadata_memo_lock:
+        _METADATA_MEMO[url] = (saved_at, meta)
+        _METADATA_MEMO.move_to_end(url)
+        if len(_METADATA_MEMO) > _METADATA_MEMO_SIZE:
+            _METADATA_MEMO.popitem(last=False)
+
+
+def _metadata_cache_paths(url: str) -> Tuple[str, str]:
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+    return (os.path.join(METADATA_CACHE_DIR, 'meta', f'{key}.json'),
+            os.path.join(METADATA_CACHE_DIR, 'logos', f'{key}.bin'))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write via a temp file in the same directory so readers never see partial files."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _load_cached_metadata(url: str, max_age: float) -> Optional[AppMetadata]:
+    """
+    Return cached ``AppMetadata`` for ``url`` if it is younger than
+    ``max_age`` seconds, otherwise ``None``.
+    """
+    if max_age <= 0:
+        return None
+    now = time.time()
+    memo = _memo_get(url)
+    if memo and now - memo[0] < max_age:
+        return memo[1]
+
+    meta_path, logo_path = _metadata_cache_paths(url)
+    try:
+        saved_at = os.path.getmtime(meta_path)
+        if now - saved_at >= max_age:
+            return None
+        with open(meta_path, 'rb') as f:
+            cached = _json_loads(f.read())
+        with open(logo_path, 'rb') as f:
+            logo_bytes = f.read()
+        meta = AppMetadata(
+            url=url,
+            name=cached['name'],
+            developer=cached['developer'],
+            logo_bytes=logo_bytes,
+            logo_mime=cached.get('logo_mime', 'image/png'),
+        )
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, stale or corrupt entry: treat as a miss
+        return None
+
+    _memo_put(url, saved_at, meta)
+    logger.debug("✅ Metadata cache hit for %s", url)
+    return meta
+
+
+# Parser fallbacks fill missing fields with these; never cache them
+_PLACEHOLDER_VALUES = frozenset({'Manual input required', 'Unknown App', 'Unknown Developer'})
+
+
+def _is_cacheable_result(result: dict) -> bool:
+    """
+    Whether a parser result is complete enough to persist.  The plain-HTTP
+    fallback (``parsed_with`` ``simple_http*``) is a degraded answer that a
+    later Selenium run should get a chance to replace.
+    """
+    if str(result.get('parsed_with', '')).startswith('simple_http'):
+        return False
+    return (result.get('name') not in _PLACEHOLDER_VALUES
+            and result.get('developer') not in _PLACEHOLDER_VALUES)
+
+
+def _save_cached_metadata(meta: AppMetadata) -> None:
+    """
+    Persist a complete fetch.  Results without a logo or with placeholder
+    name/developer are not cached so that the next run retries them.
+    """
+    if not meta.logo_bytes or meta.name in _PLACEHOLDER_VALUES or meta.developer in _PLACEHOLDER_VALUES:
+        return
+    _memo_put(meta.url, time.time(), meta)
+    meta_path, logo_path = _metadata_cache_paths(meta.url)
+    record = {'url': meta.url, 'name': meta.name, 'developer': meta.developer, 'logo_mime': meta.logo_mime}
+    try:
+        # Logo first: the JSON file marks a complete entry
+        _write_atomic(logo_path, meta.logo_bytes)
+        _write_atomic(meta_path, json.dumps(record, ensure_ascii=False).encode('utf-8'))
+    except OSError as e:
+        logger.warning("⚠️ Could not write metadata cache for %s: %s", meta.url, e)
+
+
+def _download_logo(logo_url: Optional[str], timeout: int = 20) -> Tuple[bytes, str]:
+    """
+    Download a logo through the shared session.  Errors are logged and
+    yield empty bytes so the slide keeps its placeholder.
+    """
+    if not logo_url:
+        return b'', 'image/png'
+    try:
+        img_resp = _SESSION.get(logo_url, timeout=timeout)
+        img_resp.raise_for_status()
+        logo_bytes = img_resp.content
+        logo_mime = img_resp.headers.get('Content-Type', 'image/png')
+        logger.debug("✅ Logo downloaded: %d bytes, MIME: %s", len(logo_bytes), logo_mime)
+        return logo_bytes, logo_mime
+    except Exception as e:
+        logger.warning("⚠️ Logo download error: %s", e)
+        return b'', 'image/png'
+
+
+def fetch_app_metadata(url: str, timeout: int = 20,
+                       max_age: float = METADATA_CACHE_MAX_AGE) -> Optional[AppMetadata]:
     """
     Retrieve metadata for an AppExchange listing using modern Selenium parser.
-    If extraction or download fails, ``None`` is returned.
+    Results fetched within ``max_age`` seconds are served from the local
+    cache without any network access.  If extraction or download fails,
+    ``None`` is returned.
 
     Parameters
     ----------
@@ -222,6 +454,8 @@ def fetch_app_metadata(url: str, timeout: int = 20) -> Optional[AppMetadata]:
         URL of the AppExchange listing.
     timeout: int, optional
         Maximum number of seconds to wait for HTTP requests.
+    max_age: float, optional
+        Maximum age in seconds of a cached result; ``0`` bypasses the cache.
 
     Returns
     -------
@@ -229,75 +463,158 @@ def fetch_app_metadata(url: str, timeout: int = 20) -> Optional[AppMetadata]:
         ``AppMetadata`` containing the name, developer and logo bytes
         if successful, otherwise ``None``.
     """
+    cached = _load_cached_metadata(url, max_age)
+    if cached is not None:
+        return cached
+    meta, cacheable = _fetch_app_metadata_uncached(url, timeout)
+    if meta is not None and cacheable:
+        _save_cached_metadata(meta)
+    return meta
+
+
+def _fetch_app_metadata_uncached(url: str, timeout: int) -> Tuple[Optional[AppMetadata], bool]:
+    """Fetch without the cache; also report whether the result may be persisted."""
     # Import modern Selenium parser
     try:
         from appexchange_parser import parse_appexchange_improved
-        print(f"🔄 Using modern Selenium parser for {url}")
+        logger.info("🔄 Using modern Selenium parser for %s", url)
         
         # Use modern parser with Shadow DOM support
         result = parse_appexchange_improved(url)
         
         if not result or not result.get('success'):
-            print(f"❌ Parser could not extract data from {url}")
-            return None
+            logger.warning("❌ Parser could not extract data from %s", url)
+            return None, False
             
         name = result.get('name', 'Unknown App')
         developer = result.get('developer', 'Unknown Developer')
         logo_url = result.get('logo_url')
         
-        print(f"✅ Selenium parser extracted data:")
-        print(f"   Name: {name}")
-        print(f"   Developer: {developer}")
-        print(f"   Logo URL: {logo_url}")
-        
-        # Download logo
-        logo_bytes = b''
-        logo_mime = 'image/png'
-        
-        if logo_url:
-            try:
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
-                                  '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
-                }
-                img_resp = requests.get(logo_url, headers=headers, timeout=timeout)
-                img_resp.raise_for_status()
-                logo_bytes = img_resp.content
-                logo_mime = img_resp.headers.get('Content-Type', 'image/png')
-                print(f"✅ Logo downloaded: {len(logo_bytes)} bytes, MIME: {logo_mime}")
-            except Exception as e:
-                print(f"⚠️ Logo download error: {e}")
-                logo_bytes = b''
+        logger.info("✅ Selenium parser extracted data: name=%s, developer=%s, logo_url=%s",
+                    name, developer, logo_url)
         
-        return AppMetadata(url=url, name=name, developer=developer, logo_bytes=logo_bytes, logo_mime=logo_mime)
+        logo_bytes, logo_mime = _download_logo(logo_url, timeout)
+        meta = AppMetadata(url=url, name=name, developer=developer, logo_bytes=logo_bytes, logo_mime=logo_mime)
+        return meta, _is_cacheable_result(result)
         
     except ImportError:
-        print(f"❌ Selenium parser unavailable, using fallback for {url}")
+        logger.warning("❌ Selenium parser unavailable, using fallback for %s", url)
         # Fallback to old HTML parser only if Selenium unavailable
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
-                          '(KHTML, like Gecko) Chrome/120.0 Safari/537.36'
-        }
         try:
-            resp = requests.get(url, headers=headers, timeout=timeout)
+            resp = _SESSION.get(url, timeout=timeout)
             resp.raise_for_status()
         except Exception:
-            return None
-        name, dev, logo_url = _extract_from_html(resp.text)
+            return None, False
+        name, dev, logo_url = _extract_from_html(resp.content)
         if not name or not dev or not logo_url:
-            return None
+            return None, False
+        # Resolve relative / protocol-relative logo paths against the listing URL
+        logo_url = urljoin(resp.url, logo_url)
         # Fetch logo
         try:
-            img_resp = requests.get(logo_url, headers=headers, timeout=timeout)
+            img_resp = _SESSION.get(logo_url, timeout=timeout)
             img_resp.raise_for_status()
             logo_bytes = img_resp.content
             logo_mime = img_resp.headers.get('Content-Type', 'image/png')
         except Exception:
-            return None
-        return AppMetadata(url=url, name=name, developer=dev, logo_bytes=logo_bytes, logo_mime=logo_mime)
+            return None, False
+        meta = AppMetadata(url=url, name=name, developer=dev, logo_bytes=logo_bytes, logo_mime=logo_mime)
+        return meta, True
     except Exception as e:
-        print(f"❌ Error in fetch_app_metadata: {e}")
-        return None
+        logger.error("❌ Error in fetch_app_metadata: %s", e)
+        return None, False
+
+
+def fetch_many_app_metadata(urls: List[str], timeout: int = 20, max_workers: int = 8,
+                            max_age: float = METADATA_CACHE_MAX_AGE) -> Dict[str, Optional[AppMetadata]]:
+    """
+    Batch counterpart of :func:`fetch_app_metadata`.
+
+    Cached listings are answered first; the rest are parsed through one
+    shared Selenium driver and each logo download starts as soon as its
+    listing is parsed, overlapping with the rendering of the next one.
+    Without the Selenium parser the plain-HTTP fallback is purely I/O
+    bound and the listings are fetched concurrently instead.
+
+    Parameters
+    ----------
+    urls: list of str
+        AppExchange listing URLs; duplicates are fetched once.
+    timeout: int, optional
+        Maximum number of seconds to wait for HTTP requests.
+    max_workers: int, optional
+        Upper bound on concurrent HTTP requests.
+    max_age: float, optional
+        Maximum age in seconds of a cached result; ``0`` bypasses the cache.
+
+    Returns
+    -------
+    dict
+        Maps each URL to its ``AppMetadata`` or ``None`` on failure.
+    """
+    results: Dict[str, Optional[AppMetadata]] = {}
+    unique_urls = []
+    for url in dict.fromkeys(urls):
+        cached = _load_cached_metadata(url, max_age)
+        if cached is not None:
+            results[url] = cached
+        else:
+            unique_urls.append(url)
+    if not unique_urls:
+        return results
+    workers = min(max_workers, len(unique_urls))
+
+    try:
+        from appexchange_parser import parse_multiple_appexchange_urls
+    except ImportError:
+        logger.warning("❌ Selenium parser unavailable, fetching %d listings over HTTP", len(unique_urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            fetched = executor.map(lambda u: fetch_app_metadata(u, timeout, max_age), unique_urls)
+            results.update(zip(unique_urls, fetched))
+            return results
+
+    ready = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        logo_futures = {}
+
+        def _start_logo(url, result):
+            # Download each logo while the driver moves on to the next listing
+            logo_url = result.get('logo_url') if result.get('success') else None
+            if logo_url and logo_url not in logo_futures:
+                logo_futures[logo_url] = executor.submit(_download_logo, logo_url, timeout)
+
+        try:
+            parsed = parse_multiple_appexchange_urls(unique_urls, on_result=_start_logo)
+        except Exception as e:
+            logger.error("❌ Error in fetch_many_app_metadata: %s", e)
+            parsed = {}
+
+        for url in unique_urls:
+            result = parsed.get(url)
+            if result is None:
+                # Not covered by the batch (e.g. the shared driver died); retry on its own
+                results[url] = fetch_app_metadata(url, timeout, max_age)
+            elif not result.get('success'):
+                logger.warning("❌ Parser could not extract data from %s", url)
+                results[url] = None
+            else:
+                ready.append((url, result))
+
+        logos = {logo_url: future.result() for logo_url, future in logo_futures.items()}
+
+    for url, result in ready:
+        logo_bytes, logo_mime = logos.get(result.get('logo_url'), (b'', 'image/png'))
+        meta = AppMetadata(
+            url=url,
+            name=result.get('name', 'Unknown App'),
+            developer=result.get('developer', 'Unknown Developer'),
+            logo_bytes=logo_bytes,
+            logo_mime=logo_mime,
+        )
+        if _is_cacheable_result(result):
+            _save_cached_metadata(meta)
+        results[url] = meta
+    return results
 
 
 def _remove_comments_from_slides(prs: Presentation, slide_indices: List[int]) -> None:
@@ -404,7 +721,6 @@ def _remove_slide(prs: Presentation, index: int) -> None:
     index: int
         Zero based slide index to remove.
     """
-    from pptx.oxml.ns import qn
     slide = prs.slides[index]
     slide_id = slide.slide_id
     sldIdLst = prs.slides._sldIdLst
@@ -454,9 +770,6 @@ def _remove_developer_background(slide, text_left, text_top, text_height):
     text_height: int
         Height of the text field (in EMU)
     """
-    from pptx.dml.color import RGBColor
-    from pptx.util import Pt
-    
     print(f"   🗑️ Searching for blue background to remove...")
     print(f"      Text position: left={text_left/914400:.1f}in, top={text_top/914400:.1f}in")
     
@@ -544,9 +857,6 @@ def _update_developer_background(slide, text_left, text_top, text_height, target
     target_width: float
         Target width in points
     """
-    from pptx.dml.color import RGBColor
-    from pptx.util import Pt
-    
     print(f"   🔍 Searching for blue background near developer text...")
     print(f"      Text position: left={text_left/914400:.1f}in, top={text_top/914400:.1f}in")
     
@@ -1060,6 +1370,10 @@ def create_presentation_from_template(
     # Prepare app metadata list
     apps: List[AppMetadata] = []
     overrides = app_overrides or {}
+    # Fetch every link without an override in one batch up front
+    fetched_by_link = fetch_many_app_metadata(
+        [link.strip() for link in links if link.strip() not in overrides]
+    )
     for link in links:
         link = link.strip()
         meta = None
@@ -1092,7 +1406,7 @@ def create_presentation_from_template(
             )
             print(f"   📊 Created AppMetadata: logo_bytes={len(meta.logo_bytes)} bytes")
         else:
-            fetched = fetch_app_metadata(link)
+            fetched = fetched_by_link.get(link)
             if fetched:
                 meta = fetched
         if meta is None: